@@ -7,6 +7,11 @@ class Settings(BaseSettings):
     """App settings loaded from env vars."""
 
     database_url: str = "sqlite+aiosqlite:///./treasure_hunt.db"
+    # Connection pool (ignored for SQLite)
+    database_pool_size: int = 20
+    database_max_overflow: int = 30
+    database_pool_timeout: int = 30
+    database_pool_recycle: int = 3600
     groq_api_key: str = ""
     debug: bool = True
     api_prefix: str = "/api/v1"
@@ -10,6 +10,15 @@ from app.db.models import Base
 engine_kwargs: dict = {"echo": settings.debug}
 if "sqlite" in settings.database_url:
     engine_kwargs["connect_args"] = {"check_same_thread": False}
+else:
+    engine_kwargs.update(
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+        pool_pre_ping=True,
+        pool_use_lifo=True,
+    )
 
 engine = create_async_engine(settings.database_url, **engine_kwargs)
 
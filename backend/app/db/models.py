@@ -2,7 +2,7 @@
 
 from datetime import date, datetime
 
-from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DDL, Boolean, Date, DateTime, ForeignKey, Index, Integer, String, Text, event, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -42,6 +42,18 @@ class Activity(Base):
     """Treasure hunt activity."""
 
     __tablename__ = "activities"
+    __table_args__ = (
+        # Listing is keyset-paginated newest first, optionally filtered by category
+        Index("ix_activities_created_at_id", "created_at", "id"),
+        Index("ix_activities_category_created_at_id", "category", "created_at", "id"),
+        # Serves the substring ILIKE location filter on PostgreSQL
+        Index(
+            "ix_activities_location_trgm",
+            "location_sydney",
+            postgresql_using="gin",
+            postgresql_ops={"location_sydney": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -76,3 +88,10 @@ class ActivityCompletion(Base):
 
     child: Mapped["Child"] = relationship("Child", back_populates="completions")
     activity: Mapped["Activity"] = relationship("Activity", back_populates="completions")
+
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
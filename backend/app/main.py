@@ -1,20 +1,142 @@
 """Treasure Hunt API - FastAPI application."""
 
+import hashlib
+import re
 from contextlib import asynccontextmanager
+from pathlib import Path
 
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.config import settings
 from app.db.base import init_db
+from app.services.ai_service import ai_service
+
+
+class CORSASGIMiddleware:
+    """Pure-ASGI CORS handler: answers preflights directly, adds headers to responses.
+
+    Allows any origin (echoed back so credentials work), any method and any header.
+    """
+
+    allow_methods = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = dict(scope["headers"])
+        origin = request_headers.get(b"origin")
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers: list[tuple[bytes, bytes]] = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+        ]
+
+        if scope["method"] == "OPTIONS" and b"access-control-request-method" in request_headers:
+            preflight_headers = cors_headers + [
+                (b"vary", b"Origin"),
+                (b"access-control-allow-methods", self.allow_methods),
+                (b"access-control-max-age", b"600"),
+            ]
+            requested_headers = request_headers.get(b"access-control-request-headers")
+            if requested_headers:
+                preflight_headers.append((b"access-control-allow-headers", requested_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": preflight_headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = []
+                vary = b"Origin"
+                for key, value in message.get("headers", []):
+                    lower = key.lower()
+                    if lower == b"vary":
+                        vary = value + b", Origin"
+                    elif not lower.startswith(b"access-control-allow-"):
+                        headers.append((key, value))
+                message["headers"] = headers + cors_headers + [(b"vary", vary)]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class ETagASGIMiddleware:
+    """Pure-ASGI conditional GET support for selected read endpoints.
+
+    Buffers successful GET responses on matching paths, tags them with an ETag
+    (hash of the body) and Cache-Control, and answers a matching If-None-Match with 304.
+    """
+
+    def __init__(self, app, rules: list[tuple[str, str]]):
+        self.app = app
+        self.rules = [(re.compile(pattern), cache_control.encode()) for pattern, cache_control in rules]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        cache_control = next((cc for pattern, cc in self.rules if pattern.match(scope["path"])), None)
+        if cache_control is None:
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = dict(scope["headers"]).get(b"if-none-match", b"")
+        client_etags = {tag.strip().removeprefix(b"W/") for tag in if_none_match.split(b",")}
+        start_message = None
+        passthrough = False
+        chunks: list[bytes] = []
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                if message["status"] != 200:
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            etag = b'"' + hashlib.blake2b(body, digest_size=16).hexdigest().encode() + b'"'
+            headers = [
+                (k, v) for k, v in start_message.get("headers", []) if k.lower() not in (b"etag", b"cache-control")
+            ]
+            headers += [(b"etag", etag), (b"cache-control", cache_control)]
+            if etag in client_etags or b"*" in client_etags:
+                headers = [(k, v) for k, v in headers if k.lower() not in (b"content-length", b"content-type")]
+                await send({"type": "http.response.start", "status": 304, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+            await send({**start_message, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize DB on startup."""
+    """Initialize DB and upload directory on startup; close the AI client on shutdown."""
     await init_db()
+    Path(settings.upload_dir).mkdir(parents=True, exist_ok=True)
     yield
-    # Shutdown: close connections etc. if needed
+    await ai_service.aclose()
 
 
 app = FastAPI(
@@ -22,15 +144,22 @@ app = FastAPI(
     description="Backend for kids treasure hunt activities - activities, photo validation, rewards",
     version="0.1.0",
     lifespan=lifespan,
+    # API docs are only served in debug mode
+    openapi_url="/openapi.json" if settings.debug else None,
+    docs_url="/docs" if settings.debug else None,
+    redoc_url="/redoc" if settings.debug else None,
 )
 
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Restrict in production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    ETagASGIMiddleware,
+    rules=[
+        (rf"^{re.escape(settings.api_prefix)}/activities/$", "private, max-age=30"),
+        # Token balance changes after each validated photo, so always revalidate
+        (rf"^{re.escape(settings.api_prefix)}/children/\d+(/tokens)?$", "private, no-cache"),
+    ],
 )
+app.add_middleware(CORSASGIMiddleware)  # Allows all origins; restrict in production
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 
 @app.get("/")
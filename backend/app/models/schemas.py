@@ -4,7 +4,7 @@ from datetime import date, datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class ActivityCategory(str, Enum):
@@ -19,6 +19,8 @@ class ActivityCategory(str, Enum):
 class ActivityBase(BaseModel):
     """Activity base schema."""
 
+    model_config = ConfigDict(defer_build=True)
+
     title: str
     description: str
     category: ActivityCategory
@@ -41,13 +43,23 @@ class ActivityResponse(ActivityBase):
     ai_validation_prompt: Optional[str] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ActivityPage(BaseModel):
+    """One page of activities; pass next_cursor back as `cursor` to get the next page."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    items: list[ActivityResponse]
+    next_cursor: Optional[int] = None
 
 
 class ChildBase(BaseModel):
     """Child base schema."""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     age: int = Field(ge=5, le=12)
 
@@ -85,13 +97,14 @@ class ChildResponse(ChildBase):
     id: int
     token_balance: int = 0
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CompletionResponse(BaseModel):
     """Activity completion summary for child profile."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: int
     activity_id: int
     activity_title: str
@@ -109,6 +122,8 @@ class PhotoValidationRequest(BaseModel):
 class PhotoValidationResponse(BaseModel):
     """AI photo validation result."""
 
+    model_config = ConfigDict(defer_build=True)
+
     valid: bool
     reasoning: str
     tokens_awarded: int = 0
@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.base import get_async_session
 from app.models.schemas import (
     ActivityCategory,
-    ActivityResponse,
+    ActivityPage,
     GenerateActivitiesRequest,
     PhotoValidationResponse,
 )
@@ -17,43 +17,32 @@ from app.services.activity_service import (
     persist_generated_activities,
     submit_photo_for_validation,
 )
-from app.services.ai_service import AIService
+from app.services.ai_service import ai_service
 
 router = APIRouter(prefix="/activities", tags=["activities"])
-ai_service = AIService()
 
 
-@router.get("/", response_model=list[ActivityResponse])
+@router.get("/", response_model=ActivityPage)
 async def list_activities_endpoint(
     category: Optional[ActivityCategory] = None,
     age_min: Optional[int] = None,
     age_max: Optional[int] = None,
     location: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[int] = Query(None, description="next_cursor from the previous page"),
     session: AsyncSession = Depends(get_async_session),
 ):
-    """List activities with optional filters (age, category, Sydney location)."""
-    activities = await list_activities(
+    """List activities with optional filters (age, category, Sydney location), newest first."""
+    activities, next_cursor = await list_activities(
         session,
         category=category,
         age_min=age_min,
         age_max=age_max,
         location=location,
+        limit=limit,
+        cursor=cursor,
     )
-    return [
-        ActivityResponse(
-            id=a.id,
-            title=a.title,
-            description=a.description,
-            category=ActivityCategory(a.category),
-            age_min=a.age_min,
-            age_max=a.age_max,
-            location_sydney=a.location_sydney,
-            tokens_reward=a.tokens_reward,
-            ai_validation_prompt=a.ai_validation_prompt,
-            created_at=a.created_at,
-        )
-        for a in activities
-    ]
+    return {"items": activities, "next_cursor": next_cursor}
 
 
 @router.post("/generate")
@@ -83,17 +72,15 @@ async def submit_photo_endpoint(
     if not photo.content_type or not photo.content_type.startswith("image/"):
         raise HTTPException(status_code=400, detail="File must be an image")
 
-    photo_bytes = await photo.read()
-    if len(photo_bytes) > 20 * 1024 * 1024:
-        raise HTTPException(status_code=400, detail="Image too large (max 20MB)")
-
-    valid, reasoning, tokens_awarded = await submit_photo_for_validation(
-        session=session,
-        activity_id=activity_id,
-        child_id=child_id,
-        photo_bytes=photo_bytes,
-        photo_content_type=photo.content_type or "",
-    )
+    try:
+        valid, reasoning, tokens_awarded = await submit_photo_for_validation(
+            session=session,
+            activity_id=activity_id,
+            child_id=child_id,
+            photo=photo,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return PhotoValidationResponse(
         valid=valid,
         reasoning=reasoning,
@@ -75,18 +75,18 @@ async def list_completions(
     if not child:
         raise HTTPException(status_code=404, detail="Child not found")
 
-    rows = await list_child_completions(session, child_id)
+    completions = await list_child_completions(session, child_id)
     return {
         "child_id": child_id,
         "completions": [
             CompletionResponse(
                 id=c.id,
                 activity_id=c.activity_id,
-                activity_title=a.title,
+                activity_title=c.activity.title,
                 completed_at=c.completed_at,
                 tokens_awarded=c.tokens_awarded,
                 validated=c.validated,
             )
-            for c, a in rows
+            for c in completions
         ],
     }
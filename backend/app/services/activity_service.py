@@ -1,12 +1,15 @@
 """Activity business logic - listing, generation, photo validation."""
 
+import asyncio
 import base64
 import uuid
 from pathlib import Path
 from typing import Optional
 
-from sqlalchemy import select
+from fastapi import UploadFile
+from sqlalchemy import insert, select, true, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, selectinload
 
 from app.config import settings
 from app.db.models import Activity, ActivityCompletion, Child
@@ -15,13 +18,32 @@ from app.models.schemas import (
     ActivityResponse,
     GenerateActivitiesRequest,
 )
-from app.services.ai_service import AIService
+from app.services.ai_service import ai_service
 
+MAX_PHOTO_BYTES = 20 * 1024 * 1024
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
 
-def _ensure_upload_dir() -> Path:
-    path = Path(settings.upload_dir)
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+
+async def _store_photo(photo: UploadFile, photo_path: Path) -> None:
+    """Stream an upload to disk in chunks, rejecting it as soon as it exceeds MAX_PHOTO_BYTES."""
+    size = 0
+    f = await asyncio.to_thread(photo_path.open, "wb")
+    try:
+        while chunk := await photo.read(_UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_PHOTO_BYTES:
+                raise ValueError("Image too large (max 20MB)")
+            await asyncio.to_thread(f.write, chunk)
+    except BaseException:
+        f.close()
+        photo_path.unlink(missing_ok=True)
+        raise
+    await asyncio.to_thread(f.close)
+
+
+def _encode_photo(photo_path: Path) -> str:
+    """Read a stored photo and base64-encode it. Blocking; run in a thread."""
+    return base64.b64encode(photo_path.read_bytes()).decode("ascii")
 
 
 async def list_activities(
@@ -30,9 +52,20 @@ async def list_activities(
     age_min: Optional[int] = None,
     age_max: Optional[int] = None,
     location: Optional[str] = None,
-) -> list[Activity]:
-    """List activities with optional filters."""
-    stmt = select(Activity).order_by(Activity.created_at.desc())
+    limit: int = 50,
+    cursor: Optional[int] = None,
+) -> tuple[list[Activity], Optional[int]]:
+    """
+    List a page of activities (newest first) with optional filters.
+    `cursor` is the ID of the last activity on the previous page.
+    Returns (activities, next_cursor); next_cursor is None on the last page.
+    """
+    stmt = select(Activity).order_by(Activity.created_at.desc(), Activity.id.desc())
+    if cursor is not None:
+        # Compare against the stored created_at so the keyset matches the DB's own representation
+        previous = aliased(Activity)
+        cursor_created_at = select(previous.created_at).where(previous.id == cursor).scalar_subquery()
+        stmt = stmt.where(tuple_(Activity.created_at, Activity.id) < tuple_(cursor_created_at, cursor))
     if category is not None:
         stmt = stmt.where(Activity.category == category.value)
     if age_min is not None:
@@ -41,23 +74,13 @@ async def list_activities(
         stmt = stmt.where(Activity.age_min <= age_max)
     if location is not None:
         stmt = stmt.where(Activity.location_sydney.ilike(f"%{location}%"))
-    result = await session.execute(stmt)
-    return list(result.scalars().all())
-
-
-def _activity_to_response(a: Activity) -> ActivityResponse:
-    return ActivityResponse(
-        id=a.id,
-        title=a.title,
-        description=a.description,
-        category=ActivityCategory(a.category),
-        age_min=a.age_min,
-        age_max=a.age_max,
-        location_sydney=a.location_sydney,
-        tokens_reward=a.tokens_reward,
-        ai_validation_prompt=a.ai_validation_prompt,
-        created_at=a.created_at,
-    )
+    # Fetch one extra row to know whether another page follows
+    result = await session.execute(stmt.limit(limit + 1))
+    activities = list(result.scalars().all())
+    if len(activities) <= limit:
+        return activities, None
+    activities = activities[:limit]
+    return activities, activities[-1].id
 
 
 async def persist_generated_activities(
@@ -65,25 +88,30 @@ async def persist_generated_activities(
     raw_activities: list[dict],
     req: GenerateActivitiesRequest,
 ) -> list[ActivityResponse]:
-    """Convert AI output to Activity records and persist."""
-    activities: list[Activity] = []
-    for item in raw_activities:
-        activity = Activity(
-            title=item.get("title", "Untitled"),
-            description=item.get("description", ""),
-            category=req.category.value,
-            age_min=req.age_min,
-            age_max=req.age_max,
-            location_sydney=item.get("location_sydney", req.location_sydney),
-            tokens_reward=item.get("tokens_reward", 1),
-            ai_validation_prompt=item.get("ai_validation_prompt"),
-        )
-        session.add(activity)
-        activities.append(activity)
-    await session.flush()
-    for a in activities:
-        await session.refresh(a)
-    return [_activity_to_response(a) for a in activities]
+    """Convert AI output to Activity records and persist in a single INSERT ... RETURNING."""
+    if not raw_activities:
+        return []
+    rows = [
+        {
+            "title": item.get("title", "Untitled"),
+            "description": item.get("description", ""),
+            "category": req.category.value,
+            "age_min": req.age_min,
+            "age_max": req.age_max,
+            "location_sydney": item.get("location_sydney", req.location_sydney),
+            "tokens_reward": item.get("tokens_reward", 1),
+            "ai_validation_prompt": item.get("ai_validation_prompt"),
+        }
+        for item in raw_activities
+    ]
+    result = await session.scalars(
+        insert(Activity).returning(Activity),
+        rows,
+        execution_options={"render_nulls": True},  # keep rows in one batch when some values are None
+    )
+    # RETURNING order is not guaranteed (SQLite); autoincrement ids follow input order
+    activities = sorted(result.all(), key=lambda a: a.id)
+    return [ActivityResponse.model_validate(a) for a in activities]
 
 
 async def get_activity_by_id(session: AsyncSession, activity_id: int) -> Activity | None:
@@ -101,51 +129,55 @@ async def get_child_by_id(session: AsyncSession, child_id: int) -> Child | None:
 async def list_child_completions(
     session: AsyncSession,
     child_id: int,
-) -> list[tuple[ActivityCompletion, Activity]]:
-    """List completions for a child with activity details."""
+) -> list[ActivityCompletion]:
+    """List completions for a child with their activity eagerly loaded."""
     stmt = (
-        select(ActivityCompletion, Activity)
-        .join(Activity, ActivityCompletion.activity_id == Activity.id)
+        select(ActivityCompletion)
+        .options(selectinload(ActivityCompletion.activity))
         .where(ActivityCompletion.child_id == child_id)
         .order_by(ActivityCompletion.completed_at.desc())
     )
     result = await session.execute(stmt)
-    return list(result.all())
+    return list(result.scalars().all())
 
 
 async def submit_photo_for_validation(
     session: AsyncSession,
     activity_id: int,
     child_id: int,
-    photo_bytes: bytes,
-    photo_content_type: str,
+    photo: UploadFile,
 ) -> tuple[bool, str, int]:
     """
     Store photo, run AI validation, create completion, award tokens.
     Returns (valid, reasoning, tokens_awarded).
+    Raises ValueError if the photo exceeds MAX_PHOTO_BYTES.
     """
-    activity = await get_activity_by_id(session, activity_id)
-    if not activity:
-        return False, "Activity not found", 0
-
-    child = await get_child_by_id(session, child_id)
-    if not child:
-        return False, "Child not found", 0
-
-    ai_service = AIService()
     if not ai_service.client:
         return False, "AI service not configured (GROQ_API_KEY)", 0
 
+    # Fetch both in one round-trip; only fall back to separate lookups to report which is missing
+    result = await session.execute(
+        select(Activity, Child)
+        .join(Child, true())
+        .where(Activity.id == activity_id, Child.id == child_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        if not await get_activity_by_id(session, activity_id):
+            return False, "Activity not found", 0
+        return False, "Child not found", 0
+    activity, child = row
+
     # Store photo
-    ext = "jpg" if "jpeg" in (photo_content_type or "") or "jpg" in (photo_content_type or "") else "png"
-    upload_dir = _ensure_upload_dir()
+    photo_content_type = photo.content_type or ""
+    ext = "jpg" if "jpeg" in photo_content_type or "jpg" in photo_content_type else "png"
     filename = f"{activity_id}_{child_id}_{uuid.uuid4().hex[:12]}.{ext}"
-    photo_path = str(upload_dir / filename)
-    Path(photo_path).write_bytes(photo_bytes)
+    photo_path = str(Path(settings.upload_dir) / filename)
+    await _store_photo(photo, Path(photo_path))
 
     # EXIF check - optional, use upload time if no EXIF
     # For MVP we accept all photos; could add Pillow EXIF parsing here
-    image_base64 = base64.b64encode(photo_bytes).decode("utf-8")
+    image_base64 = await asyncio.to_thread(_encode_photo, Path(photo_path))
     validation_criteria = activity.ai_validation_prompt or "Photo should show completion of the activity."
     try:
         result = await ai_service.validate_photo(
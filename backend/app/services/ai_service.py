@@ -1,43 +1,36 @@
 """AI service - Groq integration for activity generation and photo validation."""
 
 import base64
-import json
+import re
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Optional
 
-from groq import Groq
+import httpx
+import orjson
+from groq import AsyncGroq
 
 from app.config import settings
 from app.models.schemas import ActivityCategory, GenerateActivitiesRequest
 
+CATEGORY_HINTS: Mapping[str, str] = MappingProxyType(
+    {
+        "beach": "shells, sea glass, driftwood, pebbles, feathers, seaweed, interesting rocks",
+        "bush": "leaves with specific shapes, bark textures, seed pods, flowers, feathers, nuts, gumnuts",
+        "garden": "leaves by shape or color, flowers by color, seeds, petals, insects (e.g. butterfly), stones",
+        "city": "objects of a specific shape and color, signs, textures, patterns, street art, plants in parks",
+    }
+)
 
-class AIService:
-    """Handles Groq API calls for text (activities) and vision (photo validation)."""
-
-    def __init__(self):
-        self.client = Groq(api_key=settings.groq_api_key) if settings.groq_api_key else None
+# Invariant instructions go first and stay byte-identical across requests so the
+# provider can reuse its prefix cache; the per-request details are appended last.
+ACTIVITY_PROMPT_PREFIX = """You create scavenger hunt activities for kids in Sydney.
 
-    async def generate_activities(self, req: GenerateActivitiesRequest) -> list[dict]:
-        """Generate object-based scavenger hunt activities via Groq LLM."""
-        if not self.client:
-            raise ValueError("GROQ_API_KEY not configured")
-
-        category_hints = {
-            "beach": "shells, sea glass, driftwood, pebbles, feathers, seaweed, interesting rocks",
-            "bush": "leaves with specific shapes, bark textures, seed pods, flowers, feathers, nuts, gumnuts",
-            "garden": "leaves by shape or color, flowers by color, seeds, petals, insects (e.g. butterfly), stones",
-            "city": "objects of a specific shape and color, signs, textures, patterns, street art, plants in parks",
-        }
-        hints = category_hints.get(req.category.value, "natural or urban objects")
-
-        prompt = f"""Generate {req.count} scavenger hunt activities for kids aged {req.age_min}-{req.age_max} in Sydney.
-Category: {req.category.value}
-Location/area: {req.location_sydney}
-
-Each activity must be a "find an object" task that the kid can photograph. Use objects like: {hints}.
+Each activity must be a "find an object" task that the kid can photograph.
 
 Rules:
 - Be specific: include shape, color, or texture (e.g. "find a leaf shaped like a heart", "find a shell that is spiral-shaped and white", "find something round and blue").
-- Age {req.age_min}-7: simpler (e.g. "find a red flower", "find a smooth stone").
+- Age 5-7: simpler (e.g. "find a red flower", "find a smooth stone").
 - Age 8-12: can be more specific (e.g. "find a leaf with 5 pointed edges", "find a shell with stripes").
 - The kid will take a photo of the object they find; AI will validate that the photo shows the correct object.
 
@@ -47,20 +40,59 @@ For each activity provide:
 - ai_validation_prompt: Exact criteria for photo validation - object type, shape, and/or color the AI must see (e.g. "Photo must show a spiral or coiled shell, not flat or broken")
 - location_sydney: Specific place if applicable
 
-Return JSON array only, no markdown."""
+Return JSON array only, no markdown.
+
+"""
+
+# Markdown code fence the model sometimes wraps its JSON in
+_FENCE = re.compile(r"^```(?:json)?\s*(.*?)\s*```$", re.DOTALL)
+
+
+def _parse_json(text: str):
+    """Parse model output as JSON, stripping a surrounding markdown code fence if present."""
+    text = text.strip()
+    match = _FENCE.match(text)
+    return orjson.loads(match.group(1) if match else text)
 
-        completion = self.client.chat.completions.create(
+
+class AIService:
+    """Handles Groq API calls for text (activities) and vision (photo validation)."""
+
+    def __init__(self):
+        self.client: Optional[AsyncGroq] = None
+        if settings.groq_api_key:
+            # Long-lived HTTP/2 client so Groq calls reuse warm connections
+            http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+                timeout=60.0,
+            )
+            self.client = AsyncGroq(api_key=settings.groq_api_key, http_client=http_client)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client. Call on shutdown."""
+        if self.client:
+            await self.client.close()
+
+    async def generate_activities(self, req: GenerateActivitiesRequest) -> list[dict]:
+        """Generate object-based scavenger hunt activities via Groq LLM."""
+        if not self.client:
+            raise ValueError("GROQ_API_KEY not configured")
+
+        hints = CATEGORY_HINTS.get(req.category.value, "natural or urban objects")
+        prompt = ACTIVITY_PROMPT_PREFIX + (
+            f"Generate {req.count} scavenger hunt activities for kids aged {req.age_min}-{req.age_max} in Sydney.\n"
+            f"Category: {req.category.value}\n"
+            f"Location/area: {req.location_sydney}\n"
+            f"Use objects like: {hints}."
+        )
+
+        completion = await self.client.chat.completions.create(
             model="llama-3.3-70b-versatile",
             messages=[{"role": "user", "content": prompt}],
             temperature=0.8,
         )
-        text = completion.choices[0].message.content
-        # Strip markdown code blocks if present
-        if text.startswith("```"):
-            text = text.split("```")[1]
-            if text.startswith("json"):
-                text = text[4:]
-        return json.loads(text.strip())
+        return _parse_json(completion.choices[0].message.content)
 
     async def validate_photo(
         self, image_base64: str, activity_description: str, validation_criteria: str
@@ -98,15 +130,13 @@ Respond with JSON only: {{"valid": true/false, "reasoning": "brief explanation"}
             }
         ]
 
-        completion = self.client.chat.completions.create(
+        completion = await self.client.chat.completions.create(
             model="meta-llama/llama-4-scout-17b-16e-instruct",
             messages=messages,
             max_tokens=256,
             temperature=0.2,
         )
-        text = completion.choices[0].message.content
-        if text.startswith("```"):
-            text = text.split("```")[1]
-            if "json" in text[:10]:
-                text = text[text.find("{"):]
-        return json.loads(text.strip())
+        return _parse_json(completion.choices[0].message.content)
+
+
+ai_service = AIService()
@@ -1,6 +1,10 @@
 """Run the Treasure Hunt API server."""
 
+import sys
+
 import uvicorn
 
 if __name__ == "__main__":
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    # uvloop is not available on Windows; fall back to uvicorn's default loop there
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True, loop=loop)